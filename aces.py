@@ -8,14 +8,23 @@ import json
 import copy
 import re
 import math
-from functools import partial
+import bisect
+from functools import lru_cache
 from PyQt6 import QtWidgets, QtCore, QtGui
-from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QColor, QFont
+from PyQt6.QtGui import QIcon, QPainter, QPen, QBrush, QColor, QFont, QPolygonF, QPixmap
 import subprocess
 import tempfile
+import threading
+from collections import deque
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # ---------------------------
 # Paths
 # ---------------------------
@@ -31,6 +40,8 @@ OUTPUT_DIR = os.path.join(EXE_DIR, "Output")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 # path to UAssetGUI executable - user must set this or put UAssetGUI in PATH
 UASSETGUI_EXE = (DEFAULT_DATA_DIR+"/UAssetGUI.exe")  # <- update this to where you put UAssetGUI (or "UAssetGUI" if it's in PATH)
+# write indented (human-readable) JSON; off by default since the JSON outputs are only fed to UAssetGUI and then deleted
+INDENT_OUTPUT = False
 
 
 # ---------------------------
@@ -42,6 +53,7 @@ STATS_FIELDS = [
     "GraphStability", "GraphDefense", "PartsSlotBody", "PartsSlotArms",
     "PartsSlotMisc", "StealthLevel", "AircraftCost", "MaxHealth"
 ]
+STATS_FIELDS_SET = frozenset(STATS_FIELDS)  # for O(1) membership tests
 
 # Fields that use the hexagon widget (must be present in STATS_FIELDS)
 HEX_FIELDS = [
@@ -63,13 +75,53 @@ HEX_ABBRS = {
     "GraphDefense": "DEF",
 }
 
+# DataTable row names ("Row_123")
+_ROW_RE = re.compile(r"Row_(\d+)")
+
+# Qt enum values used in the paint/mouse paths, resolved once
+_LEFT_BUTTON = QtCore.Qt.MouseButton.LeftButton
+_ALIGN_TOP = QtCore.Qt.AlignmentFlag.AlignTop
+_ANTIALIASING = QPainter.RenderHint.Antialiasing
+
 # --- helper utilities ---
-def run_cmd(cmd, timeout=60):
-    """Run cmd (list) and raise subprocess.CalledProcessError on failure; returns stdout."""
-    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=timeout)
+def run_cmd(cmd, timeout=60, logger=None):
+    """
+    Run cmd (list), streaming its combined stdout/stderr line by line to logger (if given).
+    Only the last lines are kept in memory; they are returned, and included in the RuntimeError raised on failure.
+    """
+    tail = deque(maxlen=50)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    # reading stdout blocks until the process closes it, so enforce the timeout by killing the process
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        for line in proc.stdout:
+            line = line.rstrip()
+            tail.append(line)
+            if logger:
+                logger(line)
+        proc.wait()
+    except BaseException:
+        # don't leave UAssetGUI running if reading or logging its output failed
+        proc.kill()
+        proc.wait()
+        raise
+    finally:
+        timer.cancel()
+        proc.stdout.close()
+    output = "\n".join(tail)
+    # the timer may fire after a successful exit but before it is cancelled; only a killed process timed out
+    if timed_out.is_set() and proc.returncode != 0:
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
     if proc.returncode != 0:
-        raise RuntimeError(f"Command failed: {' '.join(cmd)}\nstdout:\n{proc.stdout}\nstderr:\n{proc.stderr}")
-    return proc.stdout
+        raise RuntimeError(f"Command failed: {' '.join(cmd)}\noutput:\n{output}")
+    return output
 
 # def ensure_uassetgui_available():
 #     if not shutil.which(UASSETGUI_EXE) and not Path(UASSETGUI_EXE).exists():
@@ -88,9 +140,11 @@ def run_cmd(cmd, timeout=60):
 #         cmd.append(mappings_name)
 #     run_cmd(cmd, timeout=120)
 
+@lru_cache(maxsize=1)
 def _find_uassetgui_exe():
     """
-    Resolve the UAssetGUI executable.
+    Resolve the UAssetGUI executable. The result is memoized; misses are cleared by the callers
+    so that installing UAssetGUI while the program is running is still picked up.
     Priority:
       1. If UASSETGUI_EXE is an absolute/relative path that exists -> use it.
       2. Try shutil.which on the literal "UAssetGUI.exe" and "UAssetGUI".
@@ -130,6 +184,7 @@ def ensure_uassetgui_available():
     """
     exe = _find_uassetgui_exe()
     if exe is None:
+        _find_uassetgui_exe.cache_clear()
         raise FileNotFoundError(
             "UAssetGUI executable not found. Put UAssetGUI.exe in the Data/ folder or install it on PATH, "
             "or set UASSETGUI_EXE to its full path. See UAssetGUI README for binaries."
@@ -137,26 +192,28 @@ def ensure_uassetgui_available():
     return exe
 
 
-def uasset_to_json(uasset_path: str, out_json_path: str, engine_version: str = "VER_UE4_18", aes_hex: str = None):
+def uasset_to_json(uasset_path: str, out_json_path: str, engine_version: str = "VER_UE4_18", aes_hex: str = None, logger=None):
     """
-    Convert .uasset -> .json using UAssetGUI. Raises RuntimeError with stdout/stderr if the command fails.
+    Convert .uasset -> .json using UAssetGUI. Raises RuntimeError with the tool's output if the command fails.
+    UAssetGUI output is streamed to logger (if given) as it is produced.
     """
     exe = ensure_uassetgui_available()
     cmd = [exe, "tojson", uasset_path, out_json_path, engine_version]
     if aes_hex:
         cmd.append(aes_hex)
     try:
-        out = run_cmd(cmd, timeout=180)
+        out = run_cmd(cmd, timeout=180, logger=logger)
         return out
     except Exception as e:
         # wrap into clearer error
         raise RuntimeError(f"uasset_to_json failed: {e}")
 
 
-def json_to_uasset(json_path: str, out_uasset_like_path: str, engine_version: str = "VER_UE4_18", aes_hex: str = None, mappings_name: str = None):
+def json_to_uasset(json_path: str, out_uasset_like_path: str, engine_version: str = "VER_UE4_18", aes_hex: str = None, mappings_name: str = None, logger=None):
     """
-    Convert .json -> .uasset using UAssetGUI. Returns stdout. Raises RuntimeError with stdout/stderr on failure.
+    Convert .json -> .uasset using UAssetGUI. Returns the tool's output. Raises RuntimeError with it on failure.
     We include engine_version and optional aes_hex to match UAssetGUI expectations.
+    UAssetGUI output is streamed to logger (if given) as it is produced.
     """
     exe = ensure_uassetgui_available()
     cmd = [exe, "fromjson", json_path, out_uasset_like_path, engine_version]
@@ -166,7 +223,7 @@ def json_to_uasset(json_path: str, out_uasset_like_path: str, engine_version: st
         cmd.append(mappings_name)
 
     try:
-        out = run_cmd(cmd, timeout=300)
+        out = run_cmd(cmd, timeout=300, logger=logger)
         return out
     except Exception as e:
         # ensure helpful message
@@ -179,52 +236,178 @@ def ensure_output_dir():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
     return OUTPUT_DIR
 
+def file_stamp(path):
+    """(mtime_ns, size) of path, used to tell whether a cached parse is still current."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+def index_by_plane_string(data):
+    """Map PlaneStringID -> list of rows of a datatable dict, in table order."""
+    by_plane = {}
+    for d in data["Exports"][0]["Table"]["Data"]:
+        for p in d["Value"]:
+            if p.get("Name") == "PlaneStringID":
+                by_plane.setdefault(p.get("Value"), []).append(d)
+                break
+    return by_plane
+
+def clamped_int(text, lo=0, hi=100):
+    """Parse a line edit's text as an int clamped to [lo, hi]; empty or non-numeric text counts as 0.
+
+    The hex stat edits carry a ClampedIntValidator, so the text is normally digits already and no
+    exception handling is needed when an edit is committed.
+    """
+    text = text.strip()
+    v = int(text) if text.isdigit() else 0
+    return max(lo, min(hi, v))
+
 def load_json(path):
+    # orjson is much faster on the multi-MB UAssetGUI exports; fall back to stdlib json if missing
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def save_json(data, path):
+def save_json(data, path, indent=None):
+    """Write data as JSON. indent defaults to INDENT_OUTPUT; compact output is much smaller and faster to parse."""
+    if indent is None:
+        indent = INDENT_OUTPUT
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+        return
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+        if indent:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(",", ":"))
+
+@lru_cache(maxsize=None)
+def _get_template(name):
+    """Load a bundled template from the default Data folder once. Callers must copy before mutating."""
+    return load_json(os.path.join(DEFAULT_DATA_DIR, name))
+
+def _index(entry):
+    """Map property Name -> property dict for a DataTable row (last one wins on duplicate names)."""
+    return {p.get("Name"): p for p in entry.get("Value", [])}
+
+def _fast_clone(obj):
+    """Deep copy of JSON-shaped data; an orjson round-trip is much faster than copy.deepcopy."""
+    if orjson is not None:
+        return orjson.loads(orjson.dumps(obj))
+    return copy.deepcopy(obj)
+
+def _clone_entry(template_obj):
+    """
+    Cheap clone of a flat DataTable row template: copies the row and each property dict.
+    Only valid when callers replace property "Value"s rather than mutating nested objects.
+    """
+    entry = dict(template_obj)
+    entry["Value"] = [dict(p) for p in template_obj["Value"]]
+    return entry
+
+# ---------------------------
+# PlayerPlane property handlers
+# ---------------------------
+# Build canonical SoftObjectPath dict used in this file format
+def make_soft_object_path_for(plane_str):
+    asset_name = f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_str}.AcePlayerPawn_{plane_str}_C"
+    return {
+        "$type": "UAssetAPI.PropertyTypes.Objects.FSoftObjectPath, UAssetAPI",
+        "AssetPath": {
+            "$type": "UAssetAPI.PropertyTypes.Objects.FTopLevelAssetPath, UAssetAPI",
+            "PackageName": None,
+            "AssetName": asset_name
+        },
+        "SubPathString": None
+    }
+
+def _set_plane_id(prop, ui_values, mode):
+    # Only set PlaneID when adding; in edit mode we must NOT change it
+    if mode == "add":
+        prop["Value"] = ui_values["plane_id"] or prop.get("Value", 101)
+
+def _set_flare_count(prop, ui_values, mode):
+    if ui_values.get("flare_count", -1) != -1:
+        prop["Value"] = ui_values["flare_count"]
+
+def _set_if_selected(key):
+    # Always set from UI in add or edit mode, but only when something is selected
+    def handler(prop, ui_values, mode):
+        selected = ui_values.get(key)
+        if selected:
+            prop["Value"] = selected
+    return handler
+
+def _set_reference(prop, ui_values, mode):
+    # Update the Reference nested structure so AssetName points at the plane_string_id
+    existing_val = prop.get("Value")
+    soft_obj = make_soft_object_path_for(ui_values["plane_string_id"])
+    # If the existing value is a dict with an AssetPath, update in-place to preserve surrounding structure
+    if isinstance(existing_val, dict) and "AssetPath" in existing_val:
+        try:
+            existing_val["AssetPath"]["AssetName"] = soft_obj["AssetPath"]["AssetName"]
+            # keep SubPathString if present; otherwise set to None
+            if "SubPathString" not in existing_val:
+                existing_val["SubPathString"] = None
+            prop["Value"] = existing_val
+        except Exception:
+            # fallback to canonical form
+            prop["Value"] = soft_obj
+    else:
+        # Not the expected structure - replace with canonical structured value
+        prop["Value"] = soft_obj
+
+# property Name -> handler(prop, ui_values, mode)
+PLAYER_PLANE_HANDLERS = {
+    "PlaneID": _set_plane_id,
+    "PlaneStringID": lambda prop, ui_values, mode: prop.update(Value=ui_values["plane_string_id"]),
+    "Category": lambda prop, ui_values, mode: prop.update(Value=f'EPlaneCategory::{ui_values.get("category","Fighter")}'),
+    "FlareLoadCount": _set_flare_count,
+    "SpWeaponID1": lambda prop, ui_values, mode: prop.update(Value=ui_values.get("spweapon1", "")),
+    "SpWeaponID2": lambda prop, ui_values, mode: prop.update(Value=ui_values.get("spweapon2", "")),
+    "SpWeaponID3": lambda prop, ui_values, mode: prop.update(Value=ui_values.get("spweapon3", "")),
+    "HangarSize": _set_if_selected("hangar_size"),
+    "IGCSize": _set_if_selected("igc_size"),
+    "Reference": _set_reference,
+}
 
 # ---------------------------
 # Pipeline functions (based on your originals)
 # ---------------------------
 def add_or_edit_player_plane(input_json_path, data_dir, exe_dir, ui_values, mode, logger):
-    template_path = os.path.join(DEFAULT_DATA_DIR, "player_plane_template.json")
     output_path = os.path.join(ensure_output_dir(), "PlayerPlaneDataTable.json")
 
     data = load_json(input_json_path)
-    template = load_json(template_path)
+    template = _get_template("player_plane_template.json")
     data_array = data["Exports"][0]["Table"]["Data"]
 
-    # find f18f reference (for defaults)
-    f18f_template = next(
-        (item for item in data_array if any(
-            p.get("Name") == "PlaneStringID" and p.get("Value") == "f18f"
-            for p in item.get("Value", [])
-        )),
-        None
-    )
-
     plane_string_id = ui_values["plane_string_id"]
     new_plane_id = ui_values["plane_id"]
 
-    existing_entry = next(
-        (d for d in data_array if any(
-            p.get("Name") == "PlaneStringID" and p.get("Value") == plane_string_id
-            for p in d.get("Value", [])
-        )),
-        None
-    )
+    # single pass: f18f reference (for defaults), the entry being edited, and all PlaneStringIDs (for sorting)
+    f18f_index = None
+    existing_entry = None
+    all_ids = set()
+    for entry in data_array:
+        idx = _index(entry)
+        pid = idx.get("PlaneStringID", {}).get("Value")
+        if not pid:
+            continue
+        if pid == "f18f" and f18f_index is None:
+            f18f_index = idx
+        if pid == plane_string_id and existing_entry is None:
+            existing_entry = entry
+        all_ids.add(pid)
 
     if mode == "edit" and existing_entry:
         logger(f"[PlayerPlane] Editing existing plane {plane_string_id}")
         new_element = existing_entry
     else:
         logger(f"[PlayerPlane] Adding new plane {plane_string_id}")
-        new_element = copy.deepcopy(template)
+        new_element = _fast_clone(template)
         # Name will be adjusted properly; PlaneID set below
         new_element["Name"] = f"Row_{new_plane_id or 9999}"
         data_array.append(new_element)
@@ -236,105 +419,52 @@ def add_or_edit_player_plane(input_json_path, data_dir, exe_dir, ui_values, mode
         #         prop["Value"] = "EPlaneIGCSize::PIS_Giant"
 
     def f18f_default(name):
-        if f18f_template:
-            return next((p.get("Value") for p in f18f_template["Value"] if p.get("Name") == name), 0)
+        if f18f_index and name in f18f_index:
+            return f18f_index[name].get("Value")
         return 0
 
-    # Build canonical SoftObjectPath dict used in this file format
-    def make_soft_object_path_for(plane_str):
-        asset_name = f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_str}.AcePlayerPawn_{plane_str}_C"
-        return {
-            "$type": "UAssetAPI.PropertyTypes.Objects.FSoftObjectPath, UAssetAPI",
-            "AssetPath": {
-                "$type": "UAssetAPI.PropertyTypes.Objects.FTopLevelAssetPath, UAssetAPI",
-                "PackageName": None,
-                "AssetName": asset_name
-            },
-            "SubPathString": None
-        }
-
-    # Walk properties and set values
-    for prop in new_element.get("Value", []):
-        name = prop.get("Name")
-        if name == "PlaneID":
-            # Only set PlaneID when adding; in edit mode we must NOT change it
-            if mode == "add":
-                prop["Value"] = new_plane_id or prop.get("Value", 101)
-        elif name == "PlaneStringID":
-            prop["Value"] = plane_string_id
-        elif name == "Category":
-            prop["Value"] = f'EPlaneCategory::{ui_values.get("category","Fighter")}'
-        elif name == "FlareLoadCount":
-            if ui_values.get("flare_count", -1) != -1:
-                prop["Value"] = ui_values["flare_count"]
-        elif name == "SpWeaponID1":
-            prop["Value"] = ui_values.get("spweapon1", "")
-        elif name == "SpWeaponID2":
-            prop["Value"] = ui_values.get("spweapon2", "")
-        elif name == "SpWeaponID3":
-            prop["Value"] = ui_values.get("spweapon3", "")
-        elif name == "HangarSize":
-            # Always set from UI in add or edit mode
-            selected_hangar = ui_values.get("hangar_size")
-            if selected_hangar:
-                prop["Value"] = selected_hangar
-        
-        elif name == "IGCSize":
-            selected_igc = ui_values.get("igc_size")
-            if selected_igc:
-                prop["Value"] = selected_igc
-        elif name == "Reference":
-            # Update the Reference nested structure so AssetName points at the plane_string_id
-            existing_val = prop.get("Value")
-            soft_obj = make_soft_object_path_for(plane_string_id)
-            # If the existing value is a dict with an AssetPath, update in-place to preserve surrounding structure
-            if isinstance(existing_val, dict) and "AssetPath" in existing_val:
-                try:
-                    existing_val["AssetPath"]["AssetName"] = soft_obj["AssetPath"]["AssetName"]
-                    # keep SubPathString if present; otherwise set to None
-                    if "SubPathString" not in existing_val:
-                        existing_val["SubPathString"] = None
-                    prop["Value"] = existing_val
-                except Exception:
-                    # fallback to canonical form
-                    prop["Value"] = soft_obj
-            else:
-                # Not the expected structure - replace with canonical structured value
-                prop["Value"] = soft_obj
-        elif name in ui_values.get("stat_values", {}):
-            prop["Value"] = ui_values["stat_values"][name]
-        elif name in STATS_FIELDS:
+    # Walk only the properties we have handlers for
+    props = _index(new_element)
+    for name, handler in PLAYER_PLANE_HANDLERS.items():
+        if name in props:
+            handler(props[name], ui_values, mode)
+
+    stat_values = ui_values.get("stat_values", {})
+    for name, value in stat_values.items():
+        if name in props and name not in PLAYER_PLANE_HANDLERS:
+            props[name]["Value"] = value
+    for name in STATS_FIELDS:
+        if name in props and name not in stat_values:
             # use f18f default if present, otherwise leave whatever is in template/entry
-            prop["Value"] = ui_values.get("stat_values", {}).get(
-                name,
-                f18f_default(name) if mode == "add" else prop.get("Value", f18f_default(name))
-            )
+            prop = props[name]
+            prop["Value"] = f18f_default(name) if mode == "add" else prop.get("Value", f18f_default(name))
 
             # --- ensure correct sorting numbers ---
     # Gather all plane IDs (including the new/edited one)
-    all_ids = []
-    for entry in data_array:
-        pid = next((p.get("Value") for p in entry["Value"] if p.get("Name") == "PlaneStringID"), None)
-        if pid:
-            all_ids.append(pid)
-    all_ids = sorted(set(all_ids))
+    # a newly added row was appended after all_ids was collected
+    all_ids.add(plane_string_id)
+    all_ids = sorted(all_ids)
 
     # Compute alphabetical index for this plane, starting from 200
-    alpha_index = 200 + all_ids.index(plane_string_id)
+    alpha_index = 200 + bisect.bisect_left(all_ids, plane_string_id)
 
-    for prop in new_element.get("Value", []):
-        if prop.get("Name") == "AlphabeticalSortNumber":
-            prop["Value"] = alpha_index
-        elif prop.get("Name") == "SortNumber":
-            prop["Value"] = alpha_index
+    new_index = _index(new_element)
+    for name in ("AlphabeticalSortNumber", "SortNumber"):
+        if name in new_index:
+            new_index[name]["Value"] = alpha_index
 
 
         # Ensure "Reference" and the plane_string_id are in the NameMap
-    if "NameMap" in data:
-        if f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}.AcePlayerPawn_{plane_string_id}_C" not in data["NameMap"]:
-            data["NameMap"].append(f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}.AcePlayerPawn_{plane_string_id}_C")
-        if f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}" not in data["NameMap"]:
-            data["NameMap"].append(f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}")
+    name_map = data.get("NameMap")
+    if name_map is not None:
+        name_map_set = set(name_map)
+        for name in (
+            f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}.AcePlayerPawn_{plane_string_id}_C",
+            f"/Game/Blueprint/Player/Pawn/AcePlayerPawn_{plane_string_id}",
+        ):
+            if name not in name_map_set:
+                name_map.append(name)
+                name_map_set.add(name)
         # if plane_string_id not in data["NameMap"]:
         #     data["NameMap"].append(plane_string_id)
 
@@ -345,33 +475,25 @@ def add_or_edit_player_plane(input_json_path, data_dir, exe_dir, ui_values, mode
 
 
 def add_or_edit_skins(input_json_path, data_dir, exe_dir, plane_string_id, skins, mode, logger):
-    template_path = os.path.join(DEFAULT_DATA_DIR, "skin_template.json")
     output_path = os.path.join(ensure_output_dir(), "SkinDataTable.json")
 
     data_json = load_json(input_json_path)
-    template = load_json(template_path)
+    template = _get_template("skin_template.json")
     data_array = data_json["Exports"][0]["Table"]["Data"]
 
     # In edit mode remove all skins for this plane (replace-all behavior)
     if mode == "edit":
-        data_array[:] = [entry for entry in data_array if not any(p.get("Name") == "PlaneStringID" and p.get("Value") == plane_string_id for p in entry["Value"])]
+        data_array[:] = [entry for entry in data_array if _index(entry).get("PlaneStringID", {}).get("Value") != plane_string_id]
 
-    # determine next available SkinID
-    used_ids = sorted([entry["Value"][0]["Value"] for entry in data_array if entry["Value"]])
+    # collect used SkinIDs (first property of each row); new skins take the free IDs from 101 up
+    used_ids = {
+        int(entry["Value"][0]["Value"]) for entry in data_array
+        if entry["Value"] and str(entry["Value"][0].get("Value")).isdigit()
+    }
     next_skin_id = 101
-    for uid in used_ids:
-        try:
-            uid_int = int(uid)
-        except Exception:
-            continue
-        if uid_int < 101:
-            continue
-        if uid_int != next_skin_id:
-            break
-        next_skin_id += 1
 
     def make_entry(template_obj, skin_id, plane_id, emblems, skin_no):
-        entry = json.loads(json.dumps(template_obj))
+        entry = _clone_entry(template_obj)
         entry["Name"] = f"Row_{skin_id}"
         for prop in entry["Value"]:
             pname = prop.get("Name")
@@ -397,9 +519,11 @@ def add_or_edit_skins(input_json_path, data_dir, exe_dir, plane_string_id, skins
         return entry
 
     for s in skins:
+        while next_skin_id in used_ids:
+            next_skin_id += 1
+        used_ids.add(next_skin_id)
         entry = make_entry(template, next_skin_id, plane_string_id, s["emblems"], s["skin_no"])
         data_array.append(entry)
-        next_skin_id += 1
 
     save_json(data_json, output_path)
     logger(f"[Skins] Wrote: {output_path}")
@@ -412,25 +536,22 @@ def duplicate_aircraft_viewer(input_json_path, data_dir, exe_dir, plane_string_i
     table_data = data["Exports"][0]["Table"]["Data"]
 
     # Find entries with f04e and duplicate them, replacing PlaneStringID and incrementing AircraftViewerID
-    original_f04e_entries = [entry for entry in table_data if any(
-        prop.get("Name") == "PlaneStringID" and prop.get("Value") == "f04e"
-        for prop in entry["Value"]
-    )]
+    original_f04e_entries = [entry for entry in table_data if _index(entry).get("PlaneStringID", {}).get("Value") == "f04e"]
 
     duplicated_entries = []
     for entry in original_f04e_entries:
-        new_entry = copy.deepcopy(entry)
-        match = re.match(r"Row_(\d+)", new_entry["Name"])
+        new_entry = _fast_clone(entry)
+        match = _ROW_RE.match(new_entry["Name"])
         if match:
             new_entry["Name"] = f"Row_{int(match.group(1)) + 294}"
-        for prop in new_entry["Value"]:
-            if prop["Name"] == "PlaneStringID":
-                prop["Value"] = plane_string_id
-            elif prop["Name"] == "AircraftViewerID":
-                try:
-                    prop["Value"] = int(prop["Value"]) + 294
-                except Exception:
-                    pass
+        props = _index(new_entry)
+        if "PlaneStringID" in props:
+            props["PlaneStringID"]["Value"] = plane_string_id
+        if "AircraftViewerID" in props:
+            try:
+                props["AircraftViewerID"]["Value"] = int(props["AircraftViewerID"]["Value"]) + 294
+            except Exception:
+                pass
         duplicated_entries.append(new_entry)
 
     table_data.extend(duplicated_entries)
@@ -466,22 +587,47 @@ def resolve_input_file(base_name: str, data_dir: str):
     else:
         raise FileNotFoundError(f"Neither {json_path} nor {uasset_path} found")
 
-def prepare_input(base_name: str, data_dir: str, explicit: str = None, engine_version="VER_UE4_18", aes_hex="0x68747470733A2F2F616365372E616365636F6D6261742E6A702F737065636961"):
+def prepare_input(base_name: str, data_dir: str, explicit: str = None, engine_version="VER_UE4_18", aes_hex="0x68747470733A2F2F616365372E616365636F6D6261742E6A702F737065636961", logger=None):
     """
     Returns a JSON path ready for pipeline usage.
     If explicit file path is provided, use it. Otherwise resolve automatically.
     """
     raw = Path(explicit) if explicit else resolve_input_file(base_name, data_dir)
-    json_path = normalize_to_json(raw, engine_version, aes_hex)
+    json_path = normalize_to_json(raw, engine_version, aes_hex, logger=logger)
     return json_path, raw
 
-def normalize_to_json(path_or_uasset, engine_version="VER_UE4_18", aes_hex=None):
+# (.uasset path, engine_version, aes_hex) -> (fingerprint, converted .json path)
+_normalize_cache = {}
+
+def _uasset_fingerprint(p):
+    # the table data lives in the .uexp next to the .uasset, so both count
+    uexp = p.with_suffix(".uexp")
+    return (file_stamp(p), file_stamp(uexp) if uexp.exists() else None)
+
+def datatable_stamp(path):
+    """Stamp of a .json or .uasset datatable for cache checks; .uasset inputs also cover their .uexp."""
+    p = Path(path)
+    if p.suffix.lower() == ".uasset":
+        return _uasset_fingerprint(p)
+    return file_stamp(p)
+
+def normalize_to_json(path_or_uasset, engine_version="VER_UE4_18", aes_hex=None, logger=None):
+    """
+    Return a .json path for a .json or .uasset datatable. .uasset inputs are converted with UAssetGUI into a temp
+    folder; the conversion is reused as long as the .uasset/.uexp pair is unchanged.
+    """
     p = Path(path_or_uasset)
     if p.suffix.lower() == ".json":
         return str(p)
     elif p.suffix.lower() == ".uasset":
+        key = (str(p.resolve()), engine_version, aes_hex)
+        fingerprint = _uasset_fingerprint(p)
+        cached = _normalize_cache.get(key)
+        if cached and cached[0] == fingerprint and os.path.exists(cached[1]):
+            return cached[1]
         tmp = Path(tempfile.mkdtemp()) / (p.stem + ".json")
-        uasset_to_json(str(p), str(tmp), engine_version, aes_hex)
+        uasset_to_json(str(p), str(tmp), engine_version, aes_hex, logger=logger)
+        _normalize_cache[key] = (fingerprint, str(tmp))
         return str(tmp)
     else:
         raise ValueError("Unsupported input type: " + str(p))
@@ -527,20 +673,38 @@ class PipelineThread(QtCore.QThread):
             #     else:
             #         raise ValueError("Unsupported input type: " + str(p))
 
-            pp_input, pp_source = prepare_input("PlayerPlaneDataTable", data_dir, self.params.get("pp_input"))
-            s_input,  s_source  = prepare_input("SkinDataTable", data_dir, self.params.get("s_input"))
-            av_input, av_source = prepare_input("AircraftViewerDataTable", data_dir, self.params.get("av_input"))
-    
-            # Now call your existing functions with these JSON paths
+            player_values = self.params["player_values"]
+            plane_string_id = player_values["plane_string_id"]
+
+            def table_logger(label):
+                # the tables are converted concurrently, so tag each streamed UAssetGUI line with its table
+                return lambda line: self.log_signal.emit(f"[{label}] {line}")
+
+            def player_plane_step():
+                pp_input, pp_source = prepare_input("PlayerPlaneDataTable", data_dir, self.params.get("pp_input"), logger=table_logger("PlayerPlaneDataTable"))
+                self.log_signal.emit("-> PlayerPlane step")
+                return add_or_edit_player_plane(pp_input, data_dir, EXE_DIR, player_values, mode, self.log_signal.emit), pp_source
+
+            def skin_step():
+                s_input, s_source = prepare_input("SkinDataTable", data_dir, self.params.get("s_input"), logger=table_logger("SkinDataTable"))
+                self.log_signal.emit("-> SkinData step")
+                return add_or_edit_skins(s_input, data_dir, EXE_DIR, plane_string_id, self.params["skins"], mode, self.log_signal.emit), s_source
+
+            def aircraft_viewer_step():
+                av_input, av_source = prepare_input("AircraftViewerDataTable", data_dir, self.params.get("av_input"), logger=table_logger("AircraftViewerDataTable"))
+                self.log_signal.emit("-> AircraftViewer step")
+                return duplicate_aircraft_viewer(av_input, data_dir, EXE_DIR, plane_string_id, self.log_signal.emit), av_source
+
+            # The three tables don't depend on each other: load, transform and write them concurrently.
+            # result() re-raises any step failure, which fails the pipeline as before.
             self.log_signal.emit("Starting pipeline...")
-            self.log_signal.emit("-> PlayerPlane step")
-            pp_out_json = add_or_edit_player_plane(pp_input, data_dir, EXE_DIR, self.params["player_values"], mode, self.log_signal.emit)
-    
-            self.log_signal.emit("-> SkinData step")
-            s_out_json = add_or_edit_skins(s_input, data_dir, EXE_DIR, self.params["player_values"]["plane_string_id"], self.params["skins"], mode, self.log_signal.emit)
-    
-            self.log_signal.emit("-> AircraftViewer step")
-            av_out_json = duplicate_aircraft_viewer(av_input, data_dir, EXE_DIR, self.params["player_values"]["plane_string_id"], self.log_signal.emit)
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                pp_future = pool.submit(player_plane_step)
+                s_future = pool.submit(skin_step)
+                av_future = pool.submit(aircraft_viewer_step)
+                pp_out_json, pp_source = pp_future.result()
+                s_out_json, s_source = s_future.result()
+                av_out_json, av_source = av_future.result()
     
             # After JSON outputs are written, convert them back to .uasset/.uexp
             # For each JSON we produced, convert to uasset. We'll place outputs into the Output/ directory:
@@ -553,6 +717,7 @@ class PipelineThread(QtCore.QThread):
 
                 uassetgui_exe = _find_uassetgui_exe()
                 if not uassetgui_exe:
+                    _find_uassetgui_exe.cache_clear()
                     self.log_signal.emit("UAssetGUI not found: skipping .uasset conversion. Set UASSETGUI_EXE or put UAssetGUI on PATH.")
                 else:
                     conversions = [
@@ -561,7 +726,8 @@ class PipelineThread(QtCore.QThread):
                         (av_out_json, av_source, "AircraftViewerDataTable"),
                     ]
 
-                    for json_file, src, label in conversions:
+                    def convert(item):
+                        json_file, src, label = item
                         try:
                             out_uasset = out_name(src, label)
                             self.log_signal.emit(f"Converting {json_file} -> {out_uasset}")
@@ -570,6 +736,7 @@ class PipelineThread(QtCore.QThread):
                                 out_uasset,
                                 engine_version=self.params.get("engine_version", "VER_UE4_18"),
                                 aes_hex=self.params.get("aes_hex", None),
+                                logger=table_logger(label),
                             )
                             self.log_signal.emit(f"Converted {label} -> {out_uasset}")
 
@@ -583,6 +750,10 @@ class PipelineThread(QtCore.QThread):
                         except Exception as e:
                             self.log_signal.emit(f"Failed to convert {label}: {e}")
 
+                    # the three tables are independent, so run the UAssetGUI processes side by side
+                    with ThreadPoolExecutor(max_workers=len(conversions)) as pool:
+                        list(pool.map(convert, conversions))
+
                 self.log_signal.emit("Conversion finished. uasset + uexp are in Output/.")
             except Exception as e:
                 self.log_signal.emit(f"Warning: conversion step failed: {e}")
@@ -593,9 +764,37 @@ class PipelineThread(QtCore.QThread):
             self.finished_signal.emit(False, f"Pipeline failed: {e}")
 
 
+class LoaderThread(QtCore.QThread):
+    """Parse a datatable (.json or .uasset) off the GUI thread."""
+    loaded_signal = QtCore.pyqtSignal(str, object, object)  # path, file stamp, data
+    failed_signal = QtCore.pyqtSignal(str, str)  # path, error message
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        try:
+            stamp = datatable_stamp(self.path)
+            data = load_json(normalize_to_json(self.path))
+            self.loaded_signal.emit(self.path, stamp, data)
+        except Exception as e:
+            self.failed_signal.emit(self.path, str(e))
+
+
 # ---------------------------
 # GUI widgets
 # ---------------------------
+class ClampedIntValidator(QtGui.QIntValidator):
+    """
+    QIntValidator whose fixup clamps empty or out-of-range text into [bottom, top].
+    QLineEdit only emits editingFinished for acceptable text, so without this "150" or ""
+    would be left in the edit on focus-out/Return without ever reaching the hex graph.
+    """
+    def fixup(self, text):
+        return str(clamped_int(text, self.bottom(), self.top()))
+
+
 class SkinRowWidget(QtWidgets.QWidget):
     def __init__(self, index=0):
         super().__init__()
@@ -646,9 +845,42 @@ class HexagonGraph(QtWidgets.QWidget):
         self._active_idx = None
         self._hover_idx = None
         self._margin = 30
+        # (cos, sin) of the six vertex angles, starting at the top and going clockwise
+        self._dir_table = tuple((math.cos(math.radians(-90 + i * 60)), math.sin(math.radians(-90 + i * 60))) for i in range(6))
+        # geometry-only polygons (outer hexagon + concentric grids), rebuilt on resize
+        self._cached_outer = None
+        self._cached_grids = ()
+        # widget center and per-unit-of-value offset along each vertex direction, rebuilt on resize
+        self._center = None
+        self._value_steps = None
+        # value-independent background (outer hexagon, grids, labels) and the (width, height, dpr) it was rendered for;
+        # re-rendered lazily on paint after resize, screen or theme changes
+        self._bg_pixmap = None
+        self._bg_key = None
+        # paint resources, created once instead of on every repaint
+        self._outer_pen = QPen(QColor(40, 40, 40))
+        self._outer_pen.setWidth(2)
+        self._grid_pen = QPen(QColor(200, 200, 200))
+        self._grid_pen.setStyle(QtCore.Qt.PenStyle.DashLine)
+        self._fill_pen = QPen(QColor("#AF0C1F"), 2)
+        self._fill_brush = QBrush(QColor(175, 12, 31, 160))
+        self._handle_pen = QPen(QColor(30, 30, 30))
+        self._brush_normal = QBrush(QColor(220, 220, 220))
+        self._brush_active = QBrush(QColor(255, 200, 100))
+        self._label_font = None
+        self._bold_font = None
+        self._update_label_font()
+        # theme-dependent, created lazily on paint and dropped on palette changes
+        self._text_pen = None
+        self._abbrev_labels = [HEX_ABBRS.get(f, f) for f in self.fields]
+        # coalesce valuesChanged to at most one emission per frame (~60 Hz) while dragging
+        self._emit_timer = QtCore.QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(16)
+        self._emit_timer.timeout.connect(lambda: self.valuesChanged.emit(self.getValues()))
         self.setMouseTracking(True)
 
-    def setValues(self, vals):
+    def setValues(self, vals, notify=True):
         if isinstance(vals, dict):
             self.values = [int(vals.get(f, 0)) for f in self.fields]
         else:
@@ -656,7 +888,13 @@ class HexagonGraph(QtWidgets.QWidget):
         for i in range(6):
             self.values[i] = max(0, min(100, self.values[i]))
         self.update()
-        self.valuesChanged.emit(self.values)
+        if notify:
+            self._schedule_values_changed()
+
+    def _schedule_values_changed(self):
+        # don't restart a pending timer, otherwise a continuous drag would never emit
+        if not self._emit_timer.isActive():
+            self._emit_timer.start()
 
     def getValues(self):
         return list(self.values)
@@ -664,115 +902,155 @@ class HexagonGraph(QtWidgets.QWidget):
     def sizeHint(self):
         return QtCore.QSize(300, 300)
 
-    def paintEvent(self, ev):
+    def _hex_polygon(self, cx, cy, r):
+        return QPolygonF([QtCore.QPointF(cx + r * c, cy + r * s) for c, s in self._dir_table])
+
+    def _rebuild_static_polygons(self):
         w = self.width(); h = self.height()
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        cx = w / 2; cy = h / 2
+        r = min(w, h) / 2 - self._margin
+        self._cached_outer = self._hex_polygon(cx, cy, r)
+        self._cached_grids = tuple(self._hex_polygon(cx, cy, r * frac) for frac in (0.25, 0.5, 0.75))
+        self._center = (cx, cy)
+        self._value_steps = tuple((r * c / 100.0, r * s / 100.0) for c, s in self._dir_table)
+
+    def resizeEvent(self, ev):
+        self._rebuild_static_polygons()
+        self._bg_pixmap = None
+        super().resizeEvent(ev)
+
+    def _update_label_font(self):
+        self._label_font = QFont(self.font())
+        self._label_font.setPointSize(8)
+        self._bold_font = QFont(self._label_font)
+        self._bold_font.setBold(True)
+
+    def _ensure_text_pen(self):
+        # theme-aware text color
+        if self._text_pen is None:
+            self._text_pen = QPen(self.palette().color(QtGui.QPalette.ColorRole.Text))
+
+    def changeEvent(self, ev):
+        # the background bakes in the palette's text color and the widget font
+        if ev.type() in (QtCore.QEvent.Type.PaletteChange, QtCore.QEvent.Type.FontChange):
+            if ev.type() == QtCore.QEvent.Type.FontChange:
+                self._update_label_font()
+            else:
+                self._text_pen = None
+            self._bg_pixmap = None
+            self.update()
+        super().changeEvent(ev)
 
+    def _render_background(self):
+        """Pre-render the value-independent parts (outer hexagon, grids, field labels) into a pixmap."""
+        w = self.width(); h = self.height()
         cx = w / 2; cy = h / 2
         r = min(w, h) / 2 - self._margin
 
-        # theme-aware text color
-        text_color = self.palette().color(QtGui.QPalette.ColorRole.Text)
-        painter.setPen(text_color)
+        if self._cached_outer is None:
+            self._rebuild_static_polygons()
+
+        dpr = self.devicePixelRatioF()
+        self._bg_key = (w, h, dpr)
+        pixmap = QPixmap(max(1, round(w * dpr)), max(1, round(h * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(_ANTIALIASING)
+
+        self._ensure_text_pen()
 
         # outer hexagon
-        points = [QtCore.QPointF(cx + r * math.cos(math.radians(-90 + i * 60)),
-                                 cy + r * math.sin(math.radians(-90 + i * 60))) for i in range(6)]
-        pen = QPen(QColor(40, 40, 40))
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._outer_pen)
         painter.setBrush(QtCore.Qt.GlobalColor.transparent)
-        painter.drawPolygon(*points)
+        painter.drawPolygon(self._cached_outer)
 
         # concentric grids
-        grid_pen = QPen(QColor(200, 200, 200))
-        grid_pen.setStyle(QtCore.Qt.PenStyle.DashLine)
-        painter.setPen(grid_pen)
-        for frac in (0.25, 0.5, 0.75):
-            pr = r * frac
-            pnts = [QtCore.QPointF(cx + pr * math.cos(math.radians(-90 + i * 60)),
-                                   cy + pr * math.sin(math.radians(-90 + i * 60))) for i in range(6)]
-            painter.drawPolygon(*pnts)
+        painter.setPen(self._grid_pen)
+        for grid in self._cached_grids:
+            painter.drawPolygon(grid)
+
+        # draw abbreviations at outer hex corners
+        painter.setFont(self._label_font)
+        painter.setPen(self._text_pen)
+        for i, label in enumerate(self._abbrev_labels):
+            px = cx + r * self._dir_table[i][0]
+            py = cy + r * self._dir_table[i][1]
+            dx = px - cx
+            dy = py - cy
+            norm = math.hypot(dx, dy) or 1
+            offx = dx / norm * 20
+            offy = dy / norm * 20
+            painter.drawText(QtCore.QPointF(px + offx, py + offy), label)
+
+        painter.end()
+        self._bg_pixmap = pixmap
+
+    def paintEvent(self, ev):
+        w = self.width(); h = self.height()
+        if self._bg_pixmap is None or self._bg_key != (w, h, self.devicePixelRatioF()):
+            self._render_background()
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        painter.setRenderHint(_ANTIALIASING)
+
+        cx, cy = self._center
+
+        self._ensure_text_pen()
+
+        QPointF = QtCore.QPointF
 
         # filled polygon from values
-        poly_points = []
-        for i, val in enumerate(self.values):
-            vr = r * (val / 100.0)
-            angle = math.radians(-90 + i * 60)
-            px = cx + vr * math.cos(angle)
-            py = cy + vr * math.sin(angle)
-            poly_points.append(QtCore.QPointF(px, py))
+        poly_points = self._vertex_positions()
 
         # draw polygon (color = #AF0C1F)
-        painter.setPen(QPen(QColor("#AF0C1F"), 2))
-        painter.setBrush(QBrush(QColor(175, 12, 31, 160)))
-        painter.drawPolygon(*poly_points)
+        painter.setPen(self._fill_pen)
+        painter.setBrush(self._fill_brush)
+        painter.drawPolygon(QPolygonF(poly_points))
 
         # draw handles + values
-        handle_pen = QPen(QColor(30, 30, 30))
-        painter.setPen(handle_pen)
-        font = painter.font()
-        font.setPointSize(8)
-        painter.setFont(font)
+        painter.setPen(self._handle_pen)
+        painter.setBrush(self._brush_normal)
+        for i, p in enumerate(poly_points):
+            if i != self._active_idx:
+                painter.drawEllipse(p, 6, 6)
+        if self._active_idx is not None:
+            painter.setBrush(self._brush_active)
+            painter.drawEllipse(poly_points[self._active_idx], 6, 6)
+
+        # value labels (bold)
+        painter.setFont(self._bold_font)
+        painter.setPen(self._text_pen)
         for i, p in enumerate(poly_points):
-            rect = QtCore.QRectF(p.x() - 6, p.y() - 6, 12, 12)
-            painter.setBrush(QBrush(QColor(220, 220, 220) if i != self._active_idx else QColor(255, 200, 100)))
-            painter.drawEllipse(rect)
-
-            # value labels (bold)
-            val_font = QFont(font)
-            val_font.setBold(True)
-            painter.setFont(val_font)
             dx = p.x() - cx
             dy = p.y() - cy
             norm = math.hypot(dx, dy) or 1
             offx = dx / norm * 14
             offy = dy / norm * 14
-            painter.setPen(text_color)
-            painter.drawText(QtCore.QPointF(p.x() + offx, p.y() + offy), str(self.values[i]))
-
-        # draw abbreviations at outer hex corners
-        painter.setFont(font)  # back to normal weight
-        for i, f in enumerate(self.fields):
-            angle = math.radians(-90 + i * 60)
-            px = cx + r * math.cos(angle)
-            py = cy + r * math.sin(angle)
-            dx = px - cx
-            dy = py - cy
-            norm = math.hypot(dx, dy) or 1
-            offx = dx / norm * 20
-            offy = dy / norm * 20
-            painter.setPen(text_color)
-            painter.drawText(QtCore.QPointF(px + offx, py + offy), HEX_ABBRS.get(f, f))
+            painter.drawText(QPointF(p.x() + offx, p.y() + offy), str(self.values[i]))
 
     def _vertex_positions(self):
-        w = self.width(); h = self.height()
-        cx = w / 2; cy = h / 2
-        r = min(w, h) / 2 - self._margin
-        pts = []
-        for i, val in enumerate(self.values):
-            vr = r * (val / 100.0)
-            angle = math.radians(-90 + i * 60)
-            pts.append(QtCore.QPointF(cx + vr * math.cos(angle), cy + vr * math.sin(angle)))
-        return pts
+        if self._value_steps is None:
+            self._rebuild_static_polygons()
+        cx, cy = self._center
+        QPointF = QtCore.QPointF
+        return [QPointF(cx + val * sx, cy + val * sy) for val, (sx, sy) in zip(self.values, self._value_steps)]
 
     def _vertex_dirs(self):
-        dirs = []
-        for i in range(6):
-            angle = math.radians(-90 + i * 60)
-            dirs.append((math.cos(angle), math.sin(angle)))
-        return dirs
+        return self._dir_table
 
     def mousePressEvent(self, ev):
         pos = ev.position()
         pts = self._vertex_positions()
-        best = None; best_d = 1e9
+        # compare squared distances; only the ordering and the 14px threshold matter
+        best = None; best_d = float("inf")
         for i, p in enumerate(pts):
-            d = math.hypot(p.x() - pos.x(), p.y() - pos.y())
+            dx = p.x() - pos.x(); dy = p.y() - pos.y()
+            d = dx*dx + dy*dy
             if d < best_d:
                 best_d = d; best = i
-        if best is not None and best_d <= 14:
+        if best is not None and best_d <= 14*14:
             self._active_idx = best
             self.update()
         else:
@@ -790,10 +1068,14 @@ class HexagonGraph(QtWidgets.QWidget):
 
     def mouseMoveEvent(self, ev):
         pos = ev.position()
-        if self._active_idx is not None and (ev.buttons() & QtCore.Qt.MouseButton.LeftButton):
+        if self._active_idx is not None and (ev.buttons() & _LEFT_BUTTON):
             self._set_value_from_pos(self._active_idx, pos)
 
     def mouseReleaseEvent(self, ev):
+        # deliver the final dragged values right away instead of waiting for the throttle timer
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self.valuesChanged.emit(self.getValues())
         if self._active_idx is not None:
             self._active_idx = None
             self.update()
@@ -810,7 +1092,7 @@ class HexagonGraph(QtWidgets.QWidget):
         if self.values[idx] != val:
             self.values[idx] = val
             self.update()
-            self.valuesChanged.emit(self.getValues())
+            self._schedule_values_changed()
 
 
 # ---------------------------
@@ -822,6 +1104,13 @@ class HexagonGraph(QtWidgets.QWidget):
 class MainWindow(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
+        # parsed datatables: path -> {"stamp": datatable_stamp(path), "data": ..., "by_plane": ..., "plane_ids": ...}; see _cache_entry
+        self._json_cache = {}
+        # running LoaderThreads (kept referenced until finished), their waiting callbacks by path,
+        # and the number of plane-list refreshes in flight
+        self._loaders = set()
+        self._pending_loads = {}
+        self._planes_loading = 0
         # main = QtWidgets.QVBoxLayout(self)
         main_layout = QtWidgets.QHBoxLayout(self)
         left_panel = QtWidgets.QVBoxLayout()
@@ -894,6 +1183,9 @@ class MainWindow(QtWidgets.QWidget):
 
         self.existing_combo = QtWidgets.QComboBox()
         select_row.addWidget(self.existing_combo)
+        self.planes_loading_label = QtWidgets.QLabel("Loading...")
+        self.planes_loading_label.hide()
+        select_row.addWidget(self.planes_loading_label)
         left_panel.addLayout(select_row)
 
         # start in Add mode: hide selector
@@ -986,9 +1278,16 @@ class MainWindow(QtWidgets.QWidget):
             lbl = QtWidgets.QLabel(name + ":")
             le = QtWidgets.QLineEdit()
             le.setPlaceholderText("default")
+            # hex graph stats are 0-100; the rest are plain counts/costs that may exceed that
+            if name in HEX_FIELDS:
+                le.setValidator(ClampedIntValidator(0, 100, le))
+            else:
+                le.setValidator(QtGui.QIntValidator(-1, 2147483647, le))
             self.stat_edits[name] = le
             stats_grid.addWidget(lbl, i // 2, (i % 2) * 2)
             stats_grid.addWidget(le, i // 2, (i % 2) * 2 + 1)
+        # line edits backing the hexagon graph, in HEX_FIELDS order
+        self._hex_line_edits = [self.stat_edits[f] for f in HEX_FIELDS if f in self.stat_edits]
 
         
         stats_scroll = QtWidgets.QScrollArea()
@@ -1031,7 +1330,7 @@ class MainWindow(QtWidgets.QWidget):
         self.skin_scroll.setWidgetResizable(True)
         self.skin_container = QtWidgets.QWidget()
         self.skin_layout = QtWidgets.QVBoxLayout(self.skin_container)
-        self.skin_layout.setAlignment(QtCore.Qt.AlignmentFlag.AlignTop)
+        self.skin_layout.setAlignment(_ALIGN_TOP)
         self.skin_scroll.setWidget(self.skin_container)
         skins_layout.addWidget(self.skin_scroll)
 
@@ -1053,9 +1352,6 @@ class MainWindow(QtWidgets.QWidget):
         self.edit_radio.toggled.connect(self.toggle_mode)
         self.existing_combo.currentTextChanged.connect(self.on_existing_selected)
 
-        self.try_fill_placeholders()
-
-        self.loaded_plane_id = None
         self.setLayout(main_layout)
         self.setWindowTitle("ACES - Ace Combat Expansion System")
         try:
@@ -1065,27 +1361,112 @@ class MainWindow(QtWidgets.QWidget):
         self.resize(1300, 768)
         self.setMinimumSize(1200, 768)
 
-        # initialize placeholders (if defaults exist)
-        self.try_fill_placeholders()
+        # initialize placeholders (if defaults exist) once the event loop is running, so the
+        # datatable is parsed a single time and never ahead of the first paint
+        QtCore.QTimer.singleShot(0, self.try_fill_placeholders)
 
         # internal state
         self.loaded_plane_id = None
 
+        # PlayerPlane property Name -> loader used by on_existing_selected (stats are handled separately)
+        self._prop_handlers = {
+            "PlaneID": self._load_plane_id,
+            "Category": self._load_category,
+            "FlareLoadCount": self._load_flare_count,
+            "SpWeaponID1": lambda v: self.sp1.setText(str(v) if v is not None else ""),
+            "SpWeaponID2": lambda v: self.sp2.setText(str(v) if v is not None else ""),
+            "SpWeaponID3": lambda v: self.sp3.setText(str(v) if v is not None else ""),
+        }
+
         # Connect hex widget <-> stat edits synchronization
         self.hex_widget.valuesChanged.connect(self.on_hex_values_changed)
-        for fname in HEX_FIELDS:
-            if fname in self.stat_edits:
-                le = self.stat_edits[fname]
-                le.editingFinished.connect(partial(self.on_stat_edit_changed, fname))
-
-        self.setLayout(main_layout)
+        # one shared slot for all hex edits; the sender is mapped back to its field name
+        self._edit_to_field = {self.stat_edits[f]: f for f in HEX_FIELDS if f in self.stat_edits}
+        for le in self._edit_to_field:
+            le.editingFinished.connect(self._on_any_hex_edit)
 
     # -------------------------
     # UI helpers
     # -------------------------
+    def _cached_plane_index(self, path):
+        """PlaneStringID -> list of rows for the datatable at path, built once per cached parse."""
+        cached = self._cache_entry(path)
+        if cached["by_plane"] is None:
+            cached["by_plane"] = index_by_plane_string(cached["data"])
+        return cached["by_plane"]
+
+    def _cached_plane_ids(self, path):
+        """Set of PlaneIDs used in the PlayerPlaneDataTable at path, built once per cached parse."""
+        cached = self._cache_entry(path)
+        if cached["plane_ids"] is None:
+            cached["plane_ids"] = {p.get("Value") for d in cached["data"]["Exports"][0]["Table"]["Data"] for p in d.get("Value", []) if p.get("Name") == "PlaneID"}
+        return cached["plane_ids"]
+
+    def _cache_entry(self, path):
+        path = str(path)
+        stamp = datatable_stamp(path)
+        cached = self._json_cache.get(path)
+        if cached is None or cached["stamp"] != stamp:
+            cached = self._store_cache_entry(path, stamp, load_json(normalize_to_json(path)))
+        return cached
+
+    def _store_cache_entry(self, path, stamp, data):
+        cached = {"stamp": stamp, "data": data, "by_plane": None, "plane_ids": None}
+        self._json_cache[path] = cached
+        return cached
+
+    def _load_async(self, path, on_loaded, on_failed=None):
+        """
+        Make sure the datatable at path is in the parse cache, then call on_loaded().
+        A fresh cache entry calls on_loaded right away; otherwise the file is parsed on a LoaderThread
+        and on_loaded (or on_failed(message)) runs on the GUI thread once it is done.
+        """
+        path = str(path)
+        cached = self._json_cache.get(path)
+        try:
+            if cached is not None and cached["stamp"] == datatable_stamp(path):
+                on_loaded()
+                return
+        except OSError as e:
+            if on_failed:
+                on_failed(str(e))
+            return
+
+        # share an in-flight load of the same file
+        pending = self._pending_loads.get(path)
+        if pending is not None:
+            pending.append((on_loaded, on_failed))
+            return
+        self._pending_loads[path] = [(on_loaded, on_failed)]
+
+        loader = LoaderThread(path)
+        loader.loaded_signal.connect(self._on_loader_loaded)
+        loader.failed_signal.connect(self._on_loader_failed)
+        loader.finished.connect(lambda: self._loaders.discard(loader))
+        loader.finished.connect(loader.deleteLater)
+        self._loaders.add(loader)
+        loader.start()
+
+    def _on_loader_loaded(self, path, stamp, data):
+        self._store_cache_entry(path, stamp, data)
+        for on_loaded, _ in self._pending_loads.pop(path, []):
+            on_loaded()
+
+    def _on_loader_failed(self, path, message):
+        for _, on_failed in self._pending_loads.pop(path, []):
+            if on_failed:
+                on_failed(message)
+
+    def _current_pp_path(self):
+        pp_path = self.pp_input_edit.text().strip()
+        if not pp_path:
+            pp_path = resolve_input_file("PlayerPlaneDataTable", self.data_dir_edit.text() or DEFAULT_DATA_DIR)
+        return str(pp_path)
+
     def browse_data_dir(self):
         d = QtWidgets.QFileDialog.getExistingDirectory(self, "Select Data folder", self.data_dir_edit.text() or DEFAULT_DATA_DIR)
         if d:
+            self._json_cache.clear()
             self.data_dir_edit.setText(d)
             self.update_default_input_paths(d)
 
@@ -1098,6 +1479,7 @@ class MainWindow(QtWidgets.QWidget):
         )
 
         if fname:
+            self._json_cache.clear()
             line_edit.setText(fname)
             # If the user changed the PlayerPlaneDataTable override, refresh the existing-plane list
             if line_edit is self.pp_input_edit:
@@ -1129,29 +1511,35 @@ class MainWindow(QtWidgets.QWidget):
         try:
             ppdt = resolve_input_file("PlayerPlaneDataTable", DEFAULT_DATA_DIR)
             if os.path.exists(ppdt):
-                pp_json = normalize_to_json(ppdt)
-                d = load_json(pp_json)
-                data_array = d["Exports"][0]["Table"]["Data"]
-                f18f_template = next((item for item in data_array if any(p.get("Name") == "PlaneStringID" and p.get("Value") == "f18f" for p in item.get("Value", []))), None)
-                if f18f_template:
-                    for name in STATS_FIELDS:
-                        val = next((p.get("Value") for p in f18f_template["Value"] if p.get("Name") == name), None)
-                        if val is not None and name in self.stat_edits:
-                            self.stat_edits[name].setPlaceholderText(str(val))
+                self._load_async(ppdt, lambda: self._fill_placeholders(ppdt))
+        except Exception:
+            pass
+
+    def _fill_placeholders(self, ppdt):
+        try:
+            f18f_template = (self._cached_plane_index(ppdt).get("f18f") or [None])[0]
+            if f18f_template:
+                for name in STATS_FIELDS:
+                    val = next((p.get("Value") for p in f18f_template["Value"] if p.get("Name") == name), None)
+                    if val is not None and name in self.stat_edits:
+                        self.stat_edits[name].setPlaceholderText(str(val))
         except Exception:
             pass
 
     def toggle_mode(self, checked):
         if checked:
-            self.refresh_existing_planes()
+            def select_current():
+                current_plane = self.existing_combo.currentText()
+                if current_plane and self.edit_radio.isChecked():
+                    self.on_existing_selected(current_plane)
+
             self.existing_label.show(); self.existing_combo.show()
             self.plane_string_label.hide(); self.plane_string.hide()
             self.plane_id_label.hide(); self.plane_id_edit.hide()
-            current_plane = self.existing_combo.currentText()
-            if current_plane:
-                self.on_existing_selected(current_plane)
+            self.refresh_existing_planes(on_done=select_current)
         else:
             self.existing_label.hide(); self.existing_combo.hide()
+            self.planes_loading_label.hide()
             self.plane_string_label.show(); self.plane_string.show()
             self.plane_id_label.show(); self.plane_id_edit.show()
             self.loaded_plane_id = None
@@ -1282,14 +1670,16 @@ class MainWindow(QtWidgets.QWidget):
 
             if count < current:
                 for i in range(current - 1, count - 1, -1):
-                    w = self.skin_rows.pop(i)
-                    w.setParent(None)
-                    w.deleteLater()
+                    self._discard_skin_row(self.skin_rows.pop(i))
             else:
-                for i in range(current, count):
-                    row = SkinRowWidget(i)
-                    self.skin_layout.addWidget(row)
-                    self.skin_rows.append(row)
+                self._begin_skin_rows_batch()
+                try:
+                    for i in range(current, count):
+                        row = SkinRowWidget(i)
+                        self.skin_layout.addWidget(row)
+                        self.skin_rows.append(row)
+                finally:
+                    self._end_skin_rows_batch()
 
             self.renumber_skin_rows()
         except Exception as e:
@@ -1304,22 +1694,73 @@ class MainWindow(QtWidgets.QWidget):
 
     def clear_skin_rows(self):
         for w in self.skin_rows:
-            w.setParent(None)
-            w.deleteLater()
+            self._discard_skin_row(w)
         self.skin_rows = []
 
-    def refresh_existing_planes(self):
+    def _discard_skin_row(self, w):
+        # hiding is cheap; deleteLater already defers the actual teardown to the event loop
+        w.hide()
+        self.skin_layout.removeWidget(w)
+        w.deleteLater()
+
+    def _begin_skin_rows_batch(self):
+        # avoid a layout pass + repaint per added row
+        self.skin_container.setUpdatesEnabled(False)
+        self.skin_layout.setEnabled(False)
+
+    def _end_skin_rows_batch(self):
+        self.skin_layout.setEnabled(True)
+        self.skin_layout.activate()
+        self.skin_container.setUpdatesEnabled(True)
+
+    def refresh_existing_planes(self, on_done=None):
+        """
+        Reload the existing-plane combo from the PlayerPlaneDataTable. Parsing happens on a LoaderThread
+        unless the cached parse is current; on_done (if given) runs after the combo has been filled.
+        """
         try:
+            pp_path = self._current_pp_path()
+        except Exception:
+            self._populate_existing_planes({})
+            return
+
+        def loaded():
+            self._set_planes_loading(False)
+            if self._pp_path_or_none() != pp_path:
+                return  # the input changed meanwhile; a newer refresh will fill the combo
             try:
-                pp_path = self.pp_input_edit.text().strip()
-                if not pp_path:
-                    pp_path = resolve_input_file("PlayerPlaneDataTable", self.data_dir_edit.text() or DEFAULT_DATA_DIR)
-                pp_json = normalize_to_json(pp_path)
-                data = load_json(pp_json)
+                # one pass over the rows (stopping at each row's PlaneStringID), cached with the parse
+                by_plane = self._cached_plane_index(pp_path)
             except Exception:
-                data = {"Exports": [{"Table": {"Data": []}}]}
-            planes = [p.get("Value") for d in data["Exports"][0]["Table"]["Data"] for p in d["Value"] if p.get("Name") == "PlaneStringID"]
-            unique_sorted = sorted(set([x for x in planes if x]))
+                by_plane = {}
+            self._populate_existing_planes(by_plane)
+            if on_done:
+                on_done()
+
+        def failed(message):
+            self._set_planes_loading(False)
+            if self._pp_path_or_none() == pp_path:
+                self._populate_existing_planes({})
+
+        self._set_planes_loading(True)
+        self._load_async(pp_path, loaded, failed)
+
+    def _pp_path_or_none(self):
+        try:
+            return self._current_pp_path()
+        except Exception:
+            return None
+
+    def _set_planes_loading(self, loading):
+        self._planes_loading += 1 if loading else -1
+        busy = self._planes_loading > 0
+        self.existing_combo.setEnabled(not busy)
+        self.delete_btn.setEnabled(not busy)
+        self.planes_loading_label.setVisible(busy and self.edit_radio.isChecked())
+
+    def _populate_existing_planes(self, by_plane):
+        try:
+            unique_sorted = sorted(pid for pid in by_plane if pid)
             current = self.existing_combo.currentText()
             self.existing_combo.blockSignals(True)
             self.existing_combo.clear()
@@ -1343,100 +1784,109 @@ class MainWindow(QtWidgets.QWidget):
             if not os.path.exists(pp_path):
                 self.log.append(f"PlayerPlaneDataTable not found: {pp_path}")
                 return
-            pp_json = normalize_to_json(pp_path)
-            data = load_json(pp_json)
-            entry = next((d for d in data["Exports"][0]["Table"]["Data"] if any(p.get("Name") == "PlaneStringID" and p.get("Value") == plane_string for p in d["Value"])), None)
-            if entry:
-                for name in STATS_FIELDS:
-                    self.stat_edits[name].clear()
-                self.loaded_plane_id = None
-                for prop in entry["Value"]:
-                    pname = prop.get("Name")
-                    pval = prop.get("Value")
-                    if pname == "PlaneID":
-                        self.loaded_plane_id = int(pval) if pval is not None and str(pval).isdigit() else None
-                    elif pname == "Category":
-                        text = str(pval).split("::")[-1] if pval else ""
-                        idx = self.category_combo.findText(text)
-                        if idx >= 0:
-                            self.category_combo.setCurrentIndex(idx)
-                    elif pname == "FlareLoadCount":
-                        try:
-                            self.flare_spin.setValue(int(pval))
-                        except Exception:
-                            pass
-                    elif pname == "SpWeaponID1":
-                        self.sp1.setText(str(pval) if pval is not None else "")
-                    elif pname == "SpWeaponID2":
-                        self.sp2.setText(str(pval) if pval is not None else "")
-                    elif pname == "SpWeaponID3":
-                        self.sp3.setText(str(pval) if pval is not None else "")
-                    elif pname in STATS_FIELDS:
-                        try:
-                            self.stat_edits[pname].setText(str(int(pval)))
-                        except Exception:
-                            self.stat_edits[pname].setText(str(pval) if pval is not None else "")
-                if self.loaded_plane_id is not None:
-                    self.plane_id_edit.setText(str(self.loaded_plane_id))
-                else:
-                    self.plane_id_edit.clear()
+            # batch the many setText/setCurrentIndex calls into a single repaint
+            self.setUpdatesEnabled(False)
+            try:
+                entry = (self._cached_plane_index(pp_path).get(plane_string) or [None])[0]
+                if entry:
+                    for name in STATS_FIELDS:
+                        self.stat_edits[name].clear()
+                    self.loaded_plane_id = None
+                    for prop in entry["Value"]:
+                        pname = prop.get("Name")
+                        pval = prop.get("Value")
+                        handler = self._prop_handlers.get(pname)
+                        if handler:
+                            handler(pval)
+                        elif pname in STATS_FIELDS_SET:
+                            try:
+                                self.stat_edits[pname].setText(str(int(pval)))
+                            except Exception:
+                                self.stat_edits[pname].setText(str(pval) if pval is not None else "")
+                    if self.loaded_plane_id is not None:
+                        self.plane_id_edit.setText(str(self.loaded_plane_id))
+                    else:
+                        self.plane_id_edit.clear()
+
+                # --- Pre-select HangarSize and IGCSize dropdowns when editing ---
+                hangar_value = next(
+                    (p.get("Value") for p in entry["Value"] if p.get("Name") == "HangarSize"),
+                    None
+                )
+                if hangar_value:
+                    idx = self.hangar_combo.findText(hangar_value)
+                    if idx >= 0:
+                        self.hangar_combo.setCurrentIndex(idx)
+
+                igc_value = next(
+                    (p.get("Value") for p in entry["Value"] if p.get("Name") == "IGCSize"),
+                    None
+                )
+                if igc_value:
+                    idx = self.igc_combo.findText(igc_value)
+                    if idx >= 0:
+                        self.igc_combo.setCurrentIndex(idx)
+
+                sdt_path = self.skin_input_edit.text().strip()
+                if not sdt_path:
+                    sdt_path = os.path.join(self.data_dir_edit.text() or DEFAULT_DATA_DIR, "SkinDataTable.json")
+                if not os.path.exists(sdt_path):
+                    self.populate_skin_rows_from_models([])
+                    return
+                skin_entries = self._cached_plane_index(sdt_path).get(plane_string, [])
+                skins = []
+                for s in skin_entries:
+                    skin_no = 0
+                    emblems = {"nose": False, "wing": False, "tail": False}
+                    for p in s["Value"]:
+                        if p.get("Name") == "SkinNo":
+                            try: skin_no = int(p.get("Value"))
+                            except: skin_no = 0
+                        elif p.get("Name") == "bNoseEmblem":
+                            emblems["nose"] = bool(p.get("Value"))
+                        elif p.get("Name") == "bWingEmblem":
+                            emblems["wing"] = bool(p.get("Value"))
+                        elif p.get("Name") == "bTailEmblem":
+                            emblems["tail"] = bool(p.get("Value"))
+                    skins.append({"skin_no": skin_no, "emblems": emblems})
+                self.populate_skin_rows_from_models(skins)
+                # sync the graph without the deferred valuesChanged round-trip, but still write the
+                # clamped values back so empty or out-of-range stats show (and are saved as) what the graph shows
+                vals = [clamped_int(le.text()) for le in self._hex_line_edits]
+                self.hex_widget.setValues(vals, notify=False)
+                self.on_hex_values_changed(vals)
+            finally:
+                self.setUpdatesEnabled(True)
+                self.update()
+        except Exception as e:
+            self.log.append(f"Failed to load existing plane: {e}")
 
-            # --- Pre-select HangarSize and IGCSize dropdowns when editing ---
-            hangar_value = next(
-                (p.get("Value") for p in entry["Value"] if p.get("Name") == "HangarSize"),
-                None
-            )
-            if hangar_value:
-                idx = self.hangar_combo.findText(hangar_value)
-                if idx >= 0:
-                    self.hangar_combo.setCurrentIndex(idx)
+    def _load_plane_id(self, pval):
+        self.loaded_plane_id = int(pval) if pval is not None and str(pval).isdigit() else None
 
-            igc_value = next(
-                (p.get("Value") for p in entry["Value"] if p.get("Name") == "IGCSize"),
-                None
-            )
-            if igc_value:
-                idx = self.igc_combo.findText(igc_value)
-                if idx >= 0:
-                    self.igc_combo.setCurrentIndex(idx)
+    def _load_category(self, pval):
+        text = str(pval).split("::")[-1] if pval else ""
+        idx = self.category_combo.findText(text)
+        if idx >= 0:
+            self.category_combo.setCurrentIndex(idx)
 
-            sdt_path = self.skin_input_edit.text().strip()
-            if not sdt_path:
-                sdt_path = os.path.join(self.data_dir_edit.text() or DEFAULT_DATA_DIR, "SkinDataTable.json")
-            if not os.path.exists(sdt_path):
-                self.populate_skin_rows_from_models([])
-                return
-            s_json = normalize_to_json(sdt_path)
-            sdata = load_json(s_json)
-            skin_entries = [d for d in sdata["Exports"][0]["Table"]["Data"] if any(p.get("Name") == "PlaneStringID" and p.get("Value") == plane_string for p in d["Value"])]
-            skins = []
-            for s in skin_entries:
-                skin_no = 0
-                emblems = {"nose": False, "wing": False, "tail": False}
-                for p in s["Value"]:
-                    if p.get("Name") == "SkinNo":
-                        try: skin_no = int(p.get("Value"))
-                        except: skin_no = 0
-                    elif p.get("Name") == "bNoseEmblem":
-                        emblems["nose"] = bool(p.get("Value"))
-                    elif p.get("Name") == "bWingEmblem":
-                        emblems["wing"] = bool(p.get("Value"))
-                    elif p.get("Name") == "bTailEmblem":
-                        emblems["tail"] = bool(p.get("Value"))
-                skins.append({"skin_no": skin_no, "emblems": emblems})
-            self.populate_skin_rows_from_models(skins)
-            vals = [int(self.stat_edits[f].text().strip() or 0) for f in HEX_FIELDS]
-            self.hex_widget.setValues(vals)
-        except Exception as e:
-            self.log.append(f"Failed to load existing plane: {e}")
+    def _load_flare_count(self, pval):
+        try:
+            self.flare_spin.setValue(int(pval))
+        except Exception:
+            pass
 
     def populate_skin_rows_from_models(self, skins):
         self.clear_skin_rows()
-        for i, sk in enumerate(skins):
-            row = SkinRowWidget(i)
-            row.set_values(sk.get("skin_no", i), sk.get("emblems", {}))
-            self.skin_layout.addWidget(row)
-            self.skin_rows.append(row)
+        self._begin_skin_rows_batch()
+        try:
+            for i, sk in enumerate(skins):
+                row = SkinRowWidget(i)
+                row.set_values(sk.get("skin_no", i), sk.get("emblems", {}))
+                self.skin_layout.addWidget(row)
+                self.skin_rows.append(row)
+        finally:
+            self._end_skin_rows_batch()
         self.skin_count_spin.blockSignals(True)
         self.skin_count_spin.setValue(len(self.skin_rows))
         self.skin_count_spin.blockSignals(False)
@@ -1452,16 +1902,10 @@ class MainWindow(QtWidgets.QWidget):
             else:
                 data_dir = self.data_dir_edit.text() or DEFAULT_DATA_DIR
 
-            ppdt = normalize_to_json(resolve_input_file("PlayerPlaneDataTable", data_dir))
-            data = load_json(ppdt)
-            next_free_plane_id = 101
-            existing_plane_ids = {p.get("Value") for d in data["Exports"][0]["Table"]["Data"] for p in d.get("Value", []) if p.get("Name") == "PlaneID"}
-            while next_free_plane_id in existing_plane_ids or not (100 < next_free_plane_id <= 9999):
-                next_free_plane_id += 1
-                if next_free_plane_id > 9999:
-                    print("No valid PlaneID available in the 101-9999 range.")
-                    input("Press Enter to close...")
-                    sys.exit(1)
+            existing_plane_ids = self._cached_plane_ids(resolve_input_file("PlayerPlaneDataTable", data_dir))
+            next_free_plane_id = next((i for i in range(101, 10000) if i not in existing_plane_ids), None)
+            if next_free_plane_id is None:
+                raise ValueError("No valid PlaneID available in the 101-9999 range.")
             if mode == "edit":
                 plane_string = self.existing_combo.currentText()
                 plane_id = self.loaded_plane_id
@@ -1562,23 +2006,24 @@ class MainWindow(QtWidgets.QWidget):
 
     def on_hex_values_changed(self, values):
         for i, fname in enumerate(HEX_FIELDS):
-            if fname in self.stat_edits:
-                le = self.stat_edits[fname]
-                le.blockSignals(True)
-                le.setText(str(int(values[i])))
-                le.blockSignals(False)
-
+            le = self.stat_edits.get(fname)
+            if le is None:
+                continue
+            new = str(int(values[i]))
+            if le.text() == new:
+                continue
+            le.blockSignals(True)
+            le.setText(new)
+            le.blockSignals(False)
+
+
+    def _on_any_hex_edit(self):
+        fname = self._edit_to_field.get(self.sender())
+        if fname:
+            self.on_stat_edit_changed(fname)
 
     def on_stat_edit_changed(self, fname):
-        vals = []
-        for f in HEX_FIELDS:
-            txt = self.stat_edits[f].text().strip()
-            try:
-                v = int(txt) if txt else 0
-            except Exception:
-                v = 0
-            vals.append(max(0, min(100, v)))
-        self.hex_widget.setValues(vals)
+        self.hex_widget.setValues([clamped_int(le.text()) for le in self._hex_line_edits])
 
 
 # ---------------------------